@@ -0,0 +1,92 @@
+`timescale 1ns/1ps
+
+// Testbench wrapper for the async FIFO.
+//
+// Clocks are generated here instead of from Python so the simulator can
+// free-run between the edges the test actually cares about; cocotb only
+// wakes on the FIFO-facing signals below.
+module tb_top;
+
+    localparam WIDTH = 8;
+    localparam DEPTH = 16;
+
+    // Clocks: 7 ns write period, 13 ns read period (asynchronous)
+    reg w_clk = 0;
+    reg r_clk = 0;
+
+    initial forever #3.5 w_clk = ~w_clk;
+    initial forever #6.5 r_clk = ~r_clk;
+
+    // FIFO interface, driven/observed from cocotb
+    reg              rst;
+    reg              w_en;
+    reg  [WIDTH-1:0] w_data;
+    reg              r_en;
+    wire [WIDTH-1:0] r_data;
+    wire             full;
+    wire             empty;
+
+    // Flag-transition monitor: one-cycle pulses on full rising/falling so
+    // cocotb can await a single edge instead of polling the flag per cycle
+    reg full_prev;
+    always @(posedge w_clk or posedge rst) begin
+        if (rst) full_prev <= 0;
+        else     full_prev <= full;
+    end
+
+    wire full_rise = full & ~full_prev;
+    wire full_fall = ~full & full_prev;
+
+    // Write-side BFM: streams sequential words (0, 1, 2, ...) back-to-back
+    // until the FIFO fills or bfm_limit words have been written. Python
+    // programs the limit, raises bfm_start, and wakes exactly once on
+    // bfm_done; bfm_count reports how many words were accepted.
+    reg             bfm_start = 0;  // driven from cocotb
+    reg [WIDTH-1:0] bfm_limit = 0;  // driven from cocotb
+    reg             bfm_busy  = 0;
+    reg             bfm_done  = 0;
+    reg [WIDTH-1:0] bfm_count = 0;
+
+    wire bfm_w_en = bfm_busy & ~full & (bfm_count != bfm_limit);
+
+    always @(posedge w_clk or posedge rst) begin
+        if (rst) begin
+            bfm_busy  <= 0;
+            bfm_done  <= 0;
+            bfm_count <= 0;
+        end else if (bfm_start && !bfm_busy && !bfm_done) begin
+            bfm_busy  <= 1;
+            bfm_count <= 0;
+        end else if (bfm_busy) begin
+            if (bfm_w_en)
+                bfm_count <= bfm_count + 1;
+            if (full || bfm_count == bfm_limit) begin
+                bfm_busy <= 0;
+                bfm_done <= 1;
+            end
+        end else if (!bfm_start) begin
+            bfm_done <= 0;
+        end
+    end
+
+    // The BFM takes over the write port while it is busy; otherwise the
+    // cocotb-driven regs go straight through
+    wire             fifo_w_en   = bfm_busy ? bfm_w_en  : w_en;
+    wire [WIDTH-1:0] fifo_w_data = bfm_busy ? bfm_count : w_data;
+
+    asynch_fifo #(
+        .WIDTH(WIDTH),
+        .DEPTH(DEPTH)
+    ) dut (
+        .w_clk  (w_clk),
+        .r_clk  (r_clk),
+        .rst    (rst),
+        .w_en   (fifo_w_en),
+        .w_data (fifo_w_data),
+        .r_en   (r_en),
+        .r_data (r_data),
+        .full   (full),
+        .empty  (empty)
+    );
+
+endmodule